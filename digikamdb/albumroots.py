@@ -109,12 +109,21 @@ def _albumroot_class(dk: 'Digikam') -> type:                # noqa: F821, C901
         
         @validates('_identifier')
         def _val_identifier(self, key: str, value: str):
-            """Deletes cached mountpoint."""
+            """Deletes cached mountpoint and path."""
             if hasattr(self, '_mountpoint'):
                 delattr(self, '_mountpoint')
+            if hasattr(self, '_abspath'):
+                delattr(self, '_abspath')
             if hasattr(self, '_parsed_identifier_data'):
                 delattr(self, '_parsed_identifier_data')
             return value
+        
+        @validates('_specificPath')
+        def _val_specificPath(self, key: str, value: str):
+            """Deletes cached path."""
+            if hasattr(self, '_abspath'):
+                delattr(self, '_abspath')
+            return value
 
         @property
         def specificPath(self) -> str:
@@ -325,22 +334,28 @@ def _albumroot_class(dk: 'Digikam') -> type:                # noqa: F821, C901
                 Converted to lowercase for case-insensitive roots (except mountpoint).
             """
             
+            if hasattr(self, '_abspath'):
+                return self._abspath
+            
             override = self.override
             if override is not None:
                 if 'paths' in override:
                     if self.id in override['paths']:
                         log.debug('Overriding path')
-                        return override['paths'][self.id]
+                        self._abspath = override['paths'][self.id]
+                        return self._abspath
                     path = (self.identifier + self.specificPath).rstrip('/')
                     if path in override['paths']:
                         log.debug('Overriding path')
-                        return override['paths'][path]
+                        self._abspath = override['paths'][path]
+                        return self._abspath
             
             if self.caseSensitivity:
                 relpath = self.specificPath.lstrip('/')
             else:
                 relpath = self.specificPath.lstrip('/').lower()
-            return os.path.abspath(os.path.join(self.mountpoint, relpath))
+            self._abspath = os.path.abspath(os.path.join(self.mountpoint, relpath))
+            return self._abspath
         
     return AlbumRoot
 
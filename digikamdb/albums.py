@@ -5,13 +5,13 @@ Digikam Albums
 import logging
 import os
 from datetime import date, datetime
-from typing import List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 
-from sqlalchemy import Column, func
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, func, or_
+from sqlalchemy.orm import relationship, selectinload
 from sqlalchemy.orm.exc import MultipleResultsFound
 
-from .table import DigikamTable
+from .table import DigikamTable, sqlite_datetime
 from .exceptions import DigikamDataIntegrityError, DigikamVersionError
 
 
@@ -23,9 +23,6 @@ def _album_class(dk: 'Digikam') -> type:                    # noqa: F821, C901
     Defines the Album class
     """
     
-    if not dk.is_mysql:
-        from sqlalchemy.dialects import sqlite
-    
     class Album(dk.base):
         """
         Represents a row in the table ``Albums``.
@@ -39,9 +36,7 @@ def _album_class(dk: 'Digikam') -> type:                    # noqa: F821, C901
         if (not dk.is_mysql) and (dk.db_version >= 14):
             _modificationDate = Column(
                 'modificationDate',
-                sqlite.DATETIME(
-                    storage_format = '%(year)04d-%(month)02d-%(day)02dT%(hour)02d:%(minute)02d:%(second)02d',   # noqa: E501
-                    regexp = r'(\d+)-(\d+)-(\d+)T(\d+):(\d+):(\d+)')
+                sqlite_datetime
             )
         
         _root = relationship(
@@ -58,6 +53,11 @@ def _album_class(dk: 'Digikam') -> type:                    # noqa: F821, C901
             primaryjoin = 'foreign(Image._album) == Album._id',
             back_populates = '_albumObj',
             lazy = 'dynamic')
+        # Non-dynamic version of _images, used by Albums.with_images()
+        _images_eager = relationship(
+            'Image',
+            primaryjoin = 'foreign(Image._album) == Album._id',
+            viewonly = True)
         
         # Relationship to AlbumRoot
         
@@ -194,6 +194,41 @@ class Albums(DigikamTable):
     def __init__(self, digikam: 'Digikam'):                 # noqa: F821
         super().__init__(digikam)
     
+    def with_images(
+        self,
+        albums: Iterable['Album']                           # noqa: F821
+    ) -> Dict['Album', List['Image']]:                      # noqa: F821
+        """
+        Returns the images of multiple albums.
+        
+        Iterating :attr:`Album.images` issues one ``SELECT`` per album. This
+        method loads the images of all given albums with one additional
+        query per 500 albums:
+        
+        .. code-block:: python
+            
+            albums = dk.albums.find('/my/pictures')
+            for album, images in dk.albums.with_images(albums).items():
+                for img in images:
+                    print(img.abspath)
+        
+        Args:
+            albums: The albums.
+        Returns:
+            A dict mapping each album to a list of its images, in the order
+            the albums were given.
+        
+        .. versionadded:: 0.3.6
+        """
+        albums = list(albums)
+        ids = [al.id for al in albums]
+        query = self._select().options(selectinload(self.Class._images_eager))
+        images = {}
+        for chunk in self._chunks(ids):
+            for al in query.where(self.Class._id.in_(chunk)):
+                images[al.id] = list(al._images_eager)
+        return { al: images.get(al.id, []) for al in albums }
+    
     def find(                                               # noqa: C901
         self,
         path: Union[str, bytes, os.PathLike],
@@ -220,6 +255,7 @@ class Albums(DigikamTable):
             ' (exact)' if exact else ''
         )
         abspath = os.path.abspath(path)
+        
         roots_over = []
         roots_under = []
         for r in self.digikam.albumRoots:
@@ -237,6 +273,15 @@ class Albums(DigikamTable):
                 'Database contains overlapping album roots'
             )
         
+        # Shortcut: path is an album root
+        if (
+            not exact
+            and roots_over
+            and os.path.normpath(roots_over[0].abspath) == abspath
+        ):
+            log.debug('%s is album root %d', abspath, roots_over[0].id)
+            return roots_over[0].albums.all()
+        
         # Exact matches are not possible in these cases:
         if exact:
             if not roots_over:
@@ -273,17 +318,19 @@ class Albums(DigikamTable):
                         'Database contains overlapping album roots'
                     )
             
-            # Look for matching directories:
-            log.debug('Searching for %s in root %d', rpath+'%', root.id)
+            # Look for matching directories. The condition excludes siblings
+            # like rpath + 'x'. As LIKE may ignore case, results are checked.
+            log.debug('Searching for %s in root %d', rpath, root.id)
             query = self._select(_albumRoot = root.id)
-            if root.caseSensitivity:
-                query = query.where(
-                    self.Class._relativePath.like(rpath + '%')
-                )
-            else:
-                query = query.where(
-                    func.lower(self.Class._relativePath).like(rpath + '%')
-                )
+            if rpath != '/':
+                if root.caseSensitivity:
+                    col = self.Class._relativePath
+                else:
+                    col = func.lower(self.Class._relativePath)
+                query = query.where(or_(
+                    col == rpath,
+                    col.startswith(rpath + '/', autoescape = True)
+                ))
             for al in query:
                 log.debug('Checking album %d (%s)', al.id, al.relativePath)
                 if os.path.commonpath([
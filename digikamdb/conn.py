@@ -5,11 +5,14 @@ Defines the ``Digikam`` class for database access.
 import logging
 import os
 import re
-from typing import Mapping, Optional, Union
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, Mapping, Optional, Union
 
 from sqlalchemy import text, create_engine
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.engine import Engine, URL
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from sqlalchemy.ext.declarative import DeferredReflection
 
 from .settings import Settings
@@ -44,6 +47,11 @@ class Digikam:
     A SQLAlchemy :class:`~sqlalchemy.engine.Engine` object:
         Use this object as the database engine
     
+    Every ``Digikam`` object defines its own mapped classes and reflects the
+    database schema when it is created, so creating it is relatively
+    expensive. Programs that access the database repeatedly should keep the
+    ``Digikam`` object instead of creating a new one for each access.
+    
     Access to actual data is mostly done through the following properties:
     
     * images (class :class:`~digikamdb.images.Images`)
@@ -58,17 +66,62 @@ class Digikam:
         root_override:  Can be used to override the location of album roots
                         in the file system. See `Root Overrides`_ for more
                         information.
+        pool_size:      Sets the ``pool_size`` option of SQLAlchemy.
+        max_overflow:   Sets the ``max_overflow`` option of SQLAlchemy.
+        pool_timeout:   Sets the ``pool_timeout`` option of SQLAlchemy.
+        pool_recycle:   Sets the ``pool_recycle`` option of SQLAlchemy.
+        pool_pre_ping:  Sets the ``pool_pre_ping`` option of SQLAlchemy.
+        insertmanyvalues_page_size: Sets the ``insertmanyvalues_page_size``
+                        option of SQLAlchemy (requires SQLAlchemy 2.0).
+        expire_on_commit:   Sets the ``expire_on_commit`` option of the
+                        session, see below.
+    
+    The ``pool_*``, ``max_overflow`` and ``insertmanyvalues_page_size``
+    parameters are only used when the engine is created by ``Digikam``, i.e.
+    not when ``database`` is an :class:`~sqlalchemy.engine.Engine`. Options
+    that are ``None`` are not passed to :func:`~sqlalchemy.create_engine`, as
+    not all connection pools support them (SQLite databases usually don't use a
+    :class:`~sqlalchemy.pool.QueuePool`). For MySQL servers with many
+    concurrent clients, a larger ``pool_size`` (e.g. 10 to 50) can improve
+    response times considerably.
+    
+    By default, all objects are expired when the session is committed, so
+    they are reloaded from the database on next access. Programs that change
+    many objects and commit in between can set ``expire_on_commit`` to
+    ``False`` to avoid these reloads, but will then not see changes made by
+    other database clients (e.g. the Digikam application) until they call
+    :meth:`~sqlalchemy.orm.Session.refresh` or
+    :meth:`~sqlalchemy.orm.Session.expire_all`.
+    
+    .. versionchanged:: 0.3.6
+        Added connection pool parameters, ``insertmanyvalues_page_size`` and
+        ``expire_on_commit``.
     """
     
     def __init__(
         self,
         database: Union[str, Engine],
         root_override: Optional[Mapping] = None,
-        sql_echo: bool = False
+        sql_echo: bool = False,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        pool_timeout: Optional[float] = None,
+        pool_recycle: Optional[int] = None,
+        pool_pre_ping: bool = True,
+        insertmanyvalues_page_size: Optional[int] = None,
+        expire_on_commit: bool = True,
     ):
         """
         Constructor
         """
+        engine_options = self._engine_options(
+            pool_size = pool_size,
+            max_overflow = max_overflow,
+            pool_timeout = pool_timeout,
+            pool_recycle = pool_recycle,
+            pool_pre_ping = pool_pre_ping,
+            insertmanyvalues_page_size = insertmanyvalues_page_size,
+        )
         if isinstance(database, Engine):
             log.info(
                 'Initializing Digikam object from %s',
@@ -78,7 +131,10 @@ class Digikam:
         elif isinstance(database, str):
             if database == 'digikamrc':
                 log.info('Initializing Digikam object from digikamrc')
-                self._engine = Digikam.db_from_config(sql_echo = sql_echo)
+                self._engine = Digikam.db_from_config(
+                    sql_echo = sql_echo,
+                    **engine_options
+                )
             else:
                 log.info(
                     'Initializing Digikam object from %s',
@@ -87,24 +143,69 @@ class Digikam:
                 self._engine = create_engine(
                     database,
                     future = True,
-                    echo = sql_echo)
+                    echo = sql_echo,
+                    **engine_options)
         else:
             raise TypeError('Database specification must be Engine or str')
         
+        self._is_mysql = (self._engine.dialect.name == 'mysql')
         self._db_version = self._get_db_version()
         
-        self._session = Session(self._engine, future = True)
+        self._sessionmaker = sessionmaker(
+            self._engine,
+            future = True,
+            expire_on_commit = expire_on_commit
+        )
+        self._session = self._sessionmaker()
 
         self._base = self._digikamobject_class(declarative_base())
         
-        self._settings  = Settings(self)
-        self._tags      = Tags(self)
-        self._albumRoots = AlbumRoots(self, override = root_override)
-        self._albums    = Albums(self)
-        self._images    = Images(self)
-
-        self.base.prepare(self._engine)
-        self.tags.setup()
+        # Table classes are defined on first access, see _setup()
+        self._root_override = root_override
+        self._is_set_up = False
+        self._settings  = None
+        self._tags      = None
+        self._albumRoots = None
+        self._albums    = None
+        self._images    = None
+    
+    def _setup(self):
+        """
+        Defines the table classes and reflects the database.
+        
+        As the classes reference each other, they are all defined at once
+        when one of the table objects is first accessed.
+        """
+        if self._is_set_up:
+            return
+        # Set before defining the classes to prevent recursion
+        self._is_set_up = True
+        log.debug('Defining table classes')
+        
+        try:
+            self._settings  = Settings(self)
+            self._tags      = Tags(self)
+            self._albumRoots = AlbumRoots(
+                self,
+                override = self._root_override
+            )
+            self._albums    = Albums(self)
+            self._images    = Images(self)
+            
+            # With SQLAlchemy >= 2.0, prepare() reflects all tables at once
+            # using the multi-table reflection API, so we don't reflect here.
+            self.base.prepare(self._engine)
+            self._tags.setup()
+        except Exception:
+            # Start from scratch on next access
+            self._is_set_up = False
+            self._settings  = None
+            self._tags      = None
+            self._albumRoots = None
+            self._albums    = None
+            self._images    = None
+            self._base = self._digikamobject_class(declarative_base())
+            raise
     
     _db_config_keys = dict(
         db_host = 'Database Hostname',
@@ -147,11 +248,25 @@ class Digikam:
         """Base class for table-mapped classes"""
         return self._base
     
+    @staticmethod
+    def _engine_options(**kwargs) -> Mapping:
+        """Returns the engine options that are not ``None``."""
+        return { k: v for k, v in kwargs.items() if v is not None }
+    
     @classmethod
-    def db_from_config(cls, sql_echo = False) -> Engine:    # noqa: C901
+    def db_from_config(                                     # noqa: C901
+        cls,
+        sql_echo: bool = False,
+        **engine_options
+    ) -> Engine:
         """
         Creates the database connection from :file:`digikamrc`.
         
+        Args:
+            sql_echo:       Sets the ``echo`` option of SQLAlchemy.
+            engine_options: Connection pool and other options for
+                            :func:`~sqlalchemy.create_engine`, see
+                            :class:`Digikam`.
         Returns:
             Database connection object
         Raises:
@@ -160,30 +275,8 @@ class Digikam:
         """
         try:
             configfile = os.path.join(os.path.expanduser('~'), '.config/digikamrc')
-            config = None
-            # configparser cannot process digikamrc, so we do it manually...
-            with open(configfile, 'r') as cfg:
-                for line in cfg.readlines():
-                    line = line.strip()
-                    
-                    if config is None:
-                        if line == '[Database Settings]':
-                            config = {}
-                        continue
-                    
-                    if line.startswith('['):
-                        break
-                    
-                    if '=' not in line:
-                        continue
-                    
-                    key, value = line.split('=', maxsplit=1)
-                    key, value = key.strip(), value.strip()
-                    
-                    for key1, key2 in cls._db_config_keys.items():
-                        if key == key2:
-                            config[key1] = value
-                            break
+            st = os.stat(configfile)
+            config = _read_digikamrc(configfile, st.st_mtime_ns, st.st_size)
         
         except DigikamError:                                # pragma: no cover
             raise
@@ -195,22 +288,16 @@ class Digikam:
                 if 'db_internal' in config and config['db_internal'].lower() != 'false':
                     raise DigikamConfigError('Internal Database Server is not supported')
                 
-                if 'db_port' in config:
-                    config['db_host'] = '%s:%s' % (
-                        config['db_host'],
-                        config['db_port']
-                    )
-                db_str = 'mysql+pymysql://%s:%s@%s/%s?charset=utf8' % (
-                    config['db_user'],
-                    config['db_pass'],
-                    config['db_host'],
-                    config['db_name'],
-                )
+                db_url = _mysql_url(config)
                 log.debug(
                     'Using MySQL database %s',
-                    db_str.replace(config['db_pass'], 'XXX')
+                    db_url.render_as_string(hide_password = True)
                 )
-                return create_engine(db_str, future = True, echo = sql_echo)
+                return create_engine(
+                    db_url,
+                    future = True,
+                    echo = sql_echo,
+                    **engine_options)
                 
             elif config['db_type'] == 'QSQLITE':
                 log.debug('Using SQLite database in %s', config['db_name'])
@@ -219,7 +306,8 @@ class Digikam:
                         os.path.join(config['db_name'], 'digikam4.db')
                     ),
                     future = True,
-                    echo = sql_echo)
+                    echo = sql_echo,
+                    **engine_options)
             
             else:
                 raise DigikamConfigError('Unknown database type ' + config['db_type'])
@@ -242,42 +330,54 @@ class Digikam:
         
         This will call :meth:`~sqlalchemy.orm.Session.close` and
         :meth:`~sqlalchemy.engine.Engine.dispose` for the session and engine
-        objects.
+        objects. The engine is disposed even if closing the session fails.
+        Calling ``destroy()`` again has no effect.
         """
         log.info('Scrapping Digikam object')
+        # Don't define the table classes after destroy()
+        self._is_set_up = True
         self._settings = None
         self._tags = None
         self._albumRoots = None
         self._albums = None
         self._images = None
-        self.session.close()
-        self._session = None
-        self._engine.dispose()
-        self._engine = None
+        session, self._session = self._session, None
+        engine, self._engine = self._engine, None
+        try:
+            if session is not None:
+                session.close()
+        finally:
+            if engine is not None:
+                engine.dispose()
     
     @property
     def settings(self) -> Settings:
         """The :class:`~digikamdb.settings.Settings` object"""
+        self._setup()
         return self._settings
     
     @property
     def tags(self) -> Tags:
         """The :class:`~digikamdb.tags.Tags` object"""
+        self._setup()
         return self._tags
     
     @property
     def albumRoots(self) -> AlbumRoots:
         """The :class:`~digikamdb.albumroots.AlbumRoots` object"""
+        self._setup()
         return self._albumRoots
     
     @property
     def albums(self) -> Albums:
         """The :class:`~digikamdb.albums.Albums` object"""
+        self._setup()
         return self._albums
     
     @property
     def images(self) -> Images:
         """The :class:`~digikamdb.images.Images` object"""
+        self._setup()
         return self._images
     
     @property
@@ -285,12 +385,41 @@ class Digikam:
         """The SQLAlchemy ORM session"""
         return self._session
     
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """
+        Provides a new, short-lived SQLAlchemy ORM session.
+        
+        The session is closed when the ``with`` block is left. Changes have to
+        be committed explicitly. As the session's identity map is discarded
+        afterwards, this is useful for reading large amounts of data:
+        
+        .. code-block:: python
+            
+            with dk.session_scope() as s:
+                for img in s.scalars(
+                    select(dk.images.Image).execution_options(yield_per = 1000)
+                ):
+                    print(img.name)
+        
+        .. note::
+            The table objects (:attr:`images`, :attr:`tags` etc.) and the
+            properties of mapped objects always use :attr:`session`.
+        
+        .. versionadded:: 0.3.6
+        """
+        session = self._sessionmaker()
+        try:
+            yield session
+        finally:
+            session.close()
+    
     @property
     def is_mysql(self) -> bool:
         """
         ``True`` if database is MySQL
         """
-        return (self._engine.dialect.name == 'mysql')
+        return self._is_mysql
     
     def _digikamobject_class(self, base: type) -> type:
         """
@@ -301,25 +430,116 @@ class Digikam:
         Returns:
             Class that has the parents :class:`DeferredReflection` and *base*.
         """
-        class DigikamObject(DeferredReflection, base):
+        class DigikamObject(_DigikamObjectMixin, DeferredReflection, base):
             """
             Abstract base class for objects stored in database.
             Derived from :class:`~sqlalchemy.ext.declarative.DeferredReflection`
             and :func:`~sqlalchemy.orm.declarative_base`.
             """
             __abstract__ = True
-            __mapper_args__ = {
-                'column_prefix':    '_',
-            }
             
             _digikam = self
-            
-            @property
-            def digikam(self) -> Digikam:
-                """The ``Digikam`` object"""
-                return self._digikam
         
         return DigikamObject
 
 
+class _DigikamObjectMixin:
+    """
+    Members of ``DigikamObject`` that do not depend on the ``Digikam`` object
+    
+    Defined once at module level, so :meth:`Digikam._digikamobject_class`
+    only has to set the ``Digikam`` object.
+    """
+    __mapper_args__ = {
+        'column_prefix':    '_',
+    }
+    
+    @property
+    def digikam(self) -> Digikam:
+        """The ``Digikam`` object"""
+        return self._digikam
+
+
+# Reverse mapping digikamrc key -> config key, used by db_from_config
+_DB_CONFIG_REV = {v: k for k, v in Digikam._db_config_keys.items()}
+
+# Start of the database section in digikamrc
+_DB_SECTION = sys.intern('[Database Settings]')
+
+
+@lru_cache(maxsize = 4)
+def _read_digikamrc(
+    configfile: str,
+    mtime: int,
+    size: int
+) -> Optional[Mapping[str, str]]:
+    """
+    Reads the database settings from :file:`digikamrc`.
+    
+    The result is cached. ``mtime`` and ``size`` are only used as part of
+    the cache key, so the file is read again when it has been changed.
+    
+    Returns:
+        The database settings, or ``None`` if there is no database section.
+        The result must not be modified.
+    """
+    config = None
+    # configparser cannot process digikamrc, so we do it manually...
+    with open(configfile, 'r') as cfg:
+        for line in cfg:
+            line = line.strip()
+            
+            if config is None:
+                if line == _DB_SECTION:
+                    config = {}
+                continue
+            
+            if line.startswith('['):
+                break
+            
+            if '=' not in line:
+                continue
+            
+            key, value = line.split('=', maxsplit=1)
+            key, value = key.strip(), value.strip()
+            
+            k = _DB_CONFIG_REV.get(key)
+            if k is not None:
+                config[k] = value
+    
+    return config
+
 
+def _mysql_url(config: Mapping[str, str]) -> URL:
+    """
+    Builds the MySQL connection URL from the :file:`digikamrc` settings.
+    
+    The connection uses the ``utf8mb4`` character set, so characters outside
+    the Basic Multilingual Plane are transferred correctly.
+    
+    Args:
+        config: Database settings as returned by :func:`_read_digikamrc`.
+    Returns:
+        The URL. Special characters in the password are escaped when it is
+        rendered.
+    Raises:
+        DigikamConfigError: The port is not a number.
+        KeyError:           A required setting is missing.
+    """
+    port = None
+    if config.get('db_port'):
+        try:
+            port = int(config['db_port'])
+        except ValueError:
+            raise DigikamConfigError(
+                'Invalid Database Port ' + config['db_port']
+            )
+    return URL.create(
+        'mysql+pymysql',
+        username = config['db_user'],
+        password = config['db_pass'],
+        host = config['db_host'],
+        port = port if port and port > 0 else None,
+        database = config['db_name'],
+        query = {'charset': 'utf8mb4'},
+    )
@@ -3,20 +3,18 @@ Image Comments
 """
 
 import logging
-import os
-from datetime import datetime
-from itertools import groupby
-from typing import Iterable, List, Optional, Sequence, Tuple, Union
+from typing import Iterable, Tuple, Union
 
-from sqlalchemy import Column, Integer, String, delete, text
-from sqlalchemy.orm import relationship, validates
-
-from .table import DigikamTable
 from .properties import BasicProperties
 
 
 log = logging.getLogger(__name__)
 
+
+#: Language used when none is given
+_DEFAULT_LANGUAGE = 'x-default'
+
+
 def _imageproperty_class(dk: 'Digikam'):                    # noqa: F821
     return dk.images.ImageComment
 
@@ -58,7 +56,10 @@ class ImageComments(BasicProperties):
         """
         Selects all comments with the riqht type of the parent object.
         """
-        return super()._select_self().filter_by(_type = self._type)
+        return self._select(**{
+            self._parent_id_col:    self.parent.id,
+            '_type':                self._type,
+        })
     
     def _prop_attributes(self, prop: Union[str, int, Iterable, None], **values):
         """Adds type to the standard properties."""
@@ -67,10 +68,10 @@ class ImageComments(BasicProperties):
     
     def _pre_process_key(self, prop: Union[str, Iterable, None]) -> Tuple:
         """Preprocesses key for [] operations."""
-        ret = list(super()._pre_process_key(prop))
-        if ret[0] is None or ret[0] == '':
-            ret[0] = 'x-default'
-        return tuple(ret)
+        key = super()._pre_process_key(prop)
+        if key[0] is None or key[0] == '':
+            return (_DEFAULT_LANGUAGE,) + key[1:]
+        return key
 
 
 class ImageTitles(ImageComments):
@@ -100,10 +101,12 @@ class ImageTitles(ImageComments):
     
     #: Value column
     _value_col = '_comment'
+    
+    #: Value of the ``type`` column for titles
+    _comment_type = 3
 
     def __init__(self, parent: 'Image'):                    # noqa: F821
-        # set type=3
-        super().__init__(parent, 3)
+        super().__init__(parent, self._comment_type)
     
     def __repr__(self) -> str:                              # pragma: no cover
         return '<Titles for image %d>' % self._parent.id
@@ -150,9 +153,12 @@ class ImageCaptions(ImageComments):
     Args:
         parent:     Image object the title belongs to.
     """
+    
+    #: Value of the ``type`` column for captions
+    _comment_type = 1
+    
     def __init__(self, parent: 'Image'):                    # noqa: F821
-        # set type=1
-        super().__init__(parent, 1)
+        super().__init__(parent, self._comment_type)
 
     def __repr__(self) -> str:                              # pragma: no cover
         return '<Captions for image %d>' % self._parent.id
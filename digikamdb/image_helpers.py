@@ -7,12 +7,18 @@ import os
 from datetime import datetime
 from enum import IntEnum, IntFlag
 from itertools import groupby
+from operator import itemgetter
 from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
-from sqlalchemy import Column, Integer, String, delete, text
-from sqlalchemy.orm import relationship, validates
+from sqlalchemy import Column, Float, Integer, String, select
+from sqlalchemy.orm import deferred, relationship, validates
 
-from .table import DigikamTable
+from .table import (
+    DigikamTable,
+    interned_string,
+    mysql_double,
+    sqlite_datetime
+)
 from .properties import BasicProperties
 from .exceptions import DigikamQueryError, DigikamAssignmentError
 from .types import (
@@ -31,6 +37,36 @@ from .types import (
 log = logging.getLogger(__name__)
 
 
+def _enum_lookup(enum: type) -> Mapping[int, IntEnum]:
+    """Returns a dict mapping the values of an enum to its members."""
+    return {member.value: member for member in enum}
+
+
+# Calling an IntEnum class is slow, so we look up the members in dicts.
+_orientation_lookup = _enum_lookup(Orientation)
+_color_model_lookup = _enum_lookup(ColorModel)
+_exposure_mode_lookup = _enum_lookup(ExposureMode)
+_exposure_program_lookup = _enum_lookup(ExposureProgram)
+_metering_mode_lookup = _enum_lookup(MeteringMode)
+_subject_distance_range_lookup = _enum_lookup(SubjectDistanceRange)
+_white_balance_lookup = _enum_lookup(WhiteBalance)
+
+# Flash objects are immutable, so we can share them.
+_flash_cache = tuple(Flash(value) for value in range(256))
+
+
+def _to_enum(lookup: Mapping[int, IntEnum], enum: type, value: int) -> IntEnum:
+    """
+    Converts value to a member of enum.
+    
+    Raises ``ValueError`` if value is not valid for enum.
+    """
+    try:
+        return lookup[value]
+    except KeyError:
+        return enum(value)
+
+
 def _imagecopyrightentry_class(dk: 'Digikam') -> type:      # noqa: F821
     """Returns the ImageCopyrightEntry class."""
     return dk.images.ImageCopyrightEntry
@@ -110,10 +146,15 @@ class ImageCopyright(BasicProperties):
         self,
         prop: Union[str, int, Iterable]
     ) -> Union[str, List, Tuple, None]:
-        ret = [
-            self._post_process_value(entry)
-            for entry in self._select_prop(prop)
-        ]
+        Entry = self.Class
+        rows = self._session.execute(
+            select(Entry._value, Entry._extraValue).filter_by(
+                **{self._parent_id_col: self._parent.id},
+                **self._key_kwargs(prop)
+            )
+        )
+        # Rows have the attributes used by _post_process_value
+        ret = [self._post_process_value(row) for row in rows]
         if len(ret) == 0:
             return None
         if len(ret) == 1:
@@ -144,24 +185,26 @@ class ImageCopyright(BasicProperties):
             value = [value]
         
         kwargs = self._key_kwargs(prop)
-        kwargs.update({self._parent_id_col: self._parent.id})
+        kwargs[self._parent_id_col] = self._parent.id
+        rows = []
         for v, ev in value:
             log.debug('- Setting value %s, %s', v, ev)
-            kwargs.update(value = v, extraValue = ev)
-            self._insert(**kwargs)
+            rows.append(dict(kwargs, _value = v, _extraValue = ev))
+        if rows:
+            self._session.bulk_insert_mappings(self.Class, rows)
 
     def items(self) -> Iterable:
-        for prop, rows in groupby(
-            self._select_self().order_by(text('property')),
-            lambda x: x._property,
-        ):
-            value = [self._post_process_value(row) for row in rows]
-            if len(value) == 0:
-                value = None
+        Entry = self.Class
+        rows = self._session.execute(
+            select(Entry._property, Entry._value, Entry._extraValue)
+            .filter_by(**{self._parent_id_col: self._parent.id})
+            .order_by(Entry._property)
+        )
+        for prop, group in groupby(rows, itemgetter(0)):
+            # Same values as __getitem__ returns
+            value = [self._post_process_value(row) for row in group]
             if len(value) == 1:
                 value = value[0]
-                if value[1] is None:
-                    value = value[0]
             yield prop, value
     
     def remove(self, prop: Union[str, int, Iterable]):
@@ -177,13 +220,15 @@ class ImageCopyright(BasicProperties):
             prop,
             self._parent.id,
         )
-        for row in self._select_prop(prop):
-            self._session.delete(row)
+        self._delete(
+            **{self._parent_id_col: self._parent.id},
+            **self._key_kwargs(prop)
+        )
     
     def _key_kwargs(self, prop: Union[str, int, Iterable]):
         """Prepare kwargs for key"""
         kwargs = {}
-        for k, v in dict(zip(self._key_col, self._pre_process_key(prop))).items():
+        for k, v in zip(self._key_col, self._pre_process_key(prop)):
             if v is None:
                 log.debug('Discarding key %s', k)
             else:
@@ -203,18 +248,19 @@ class ImageCopyright(BasicProperties):
 
     def _post_process_value(
         self,
-        obj: 'DigikamObject'                                # noqa: F821
+        obj: Union['DigikamObject', 'Row']                  # noqa: F821
     ) -> Union[str, int, Tuple, None]:
         """
         Postprocesses values from [] operations.
-        """
-        val = super()._post_process_value(obj)
         
+        ``obj`` can also be a result row containing ``_value`` and
+        ``_extraValue``.
+        """
         # Only return value if extraValue is None:
-        if val[1] is None:
-            return val[0]
+        if obj._extraValue is None:
+            return obj._value
         
-        return val
+        return (obj._value, obj._extraValue)
 
 
 def define_image_helper_tables(container: 'Images'):        # noqa: F821, C901
@@ -222,12 +268,6 @@ def define_image_helper_tables(container: 'Images'):        # noqa: F821, C901
     
     dk = container.digikam
     
-    if dk.is_mysql:
-        from sqlalchemy.dialects import mysql
-    else:
-        from sqlalchemy.dialects import sqlite
-        
-    
     class ImageComment(dk.base):
         """
         Digikam Image Comment
@@ -236,18 +276,20 @@ def define_image_helper_tables(container: 'Images'):        # noqa: F821, C901
         :attr:`~Image.caption` and :attr:`~Image.title`.
         """
         __tablename__ = 'ImageComments'
+        
+        _language = Column('language', interned_string)
+        _author = Column('author', interned_string)
     
         if not dk.is_mysql:
-            _date = Column('date', sqlite.DATETIME(
-                storage_format = '%(year)04d-%(month)02d-%(day)02dT%(hour)02d:%(minute)02d:%(second)02d',   # noqa: E501
-                regexp = r'(\d+)-(\d+)-(\d+)T(\d+):(\d+):(\d+)'
-            ))
+            _date = Column('date', sqlite_datetime)
     
     class ImageCopyrightEntry(dk.base):
         """
         Digikam Image Copyright
         """
         __tablename__ = 'ImageCopyright'
+        
+        _property = Column('property', interned_string)
     
     class ImageHistory(dk.base):
         """
@@ -281,24 +323,18 @@ def define_image_helper_tables(container: 'Images'):        # noqa: F821, C901
         
         @validates('_rating')
         def _validate_rating(self, key: int, value: int) -> int:
-            if value < -1 or value > 5:
+            if not -1 <= value <= 5:
                 raise DigikamAssignmentError('Image rating must be from -1 to 5')
             return value
         
         if not dk.is_mysql:
             _creationDate = Column(
                 'creationDate',
-                sqlite.DATETIME(
-                    storage_format = '%(year)04d-%(month)02d-%(day)02dT%(hour)02d:%(minute)02d:%(second)02d',   # noqa: E501
-                    regexp = r'(\d+)-(\d+)-(\d+)T(\d+):(\d+):(\d+)'
-                )
+                sqlite_datetime
             )
             _digitizationDate = Column(
                 'digitizationDate',
-                sqlite.DATETIME(
-                    storage_format = '%(year)04d-%(month)02d-%(day)02dT%(hour)02d:%(minute)02d:%(second)02d',   # noqa: E501
-                    regexp = r'(\d+)-(\d+)-(\d+)T(\d+):(\d+):(\d+)'
-                )
+                sqlite_datetime
             )
         
         @property
@@ -324,7 +360,9 @@ def define_image_helper_tables(container: 'Images'):        # noqa: F821, C901
         def orientation(self) -> Optional[Orientation]:
             """The image's orientation (read-only)"""
             if self._orientation:
-                return Orientation(self._orientation)
+                return _to_enum(
+                    _orientation_lookup, Orientation, self._orientation
+                )
             else:
                 return None
         
@@ -360,14 +398,16 @@ def define_image_helper_tables(container: 'Images'):        # noqa: F821, C901
                 return None
             else:
                 try:
-                    return ColorModel(self._colorModel)
+                    return _to_enum(
+                        _color_model_lookup, ColorModel, self._colorModel
+                    )
                 except ValueError:
                     log.warning('%d is not a valid color model', self._colorModel)
                     return self._colorModel
         
         @validates('_orientation', '_colorModel')
         def _convert_to_int(self, key, value):
-            return int(value)
+            return value if type(value) is int else int(value)
     
     class ImageMetadata(dk.base):
         """
@@ -379,11 +419,11 @@ def define_image_helper_tables(container: 'Images'):        # noqa: F821, C901
         
         # Retrieve double as float
         if dk.is_mysql:
-            _aperture = Column('aperture', mysql.DOUBLE(asdecimal = False))
-            _focalLength = Column('focalLength', mysql.DOUBLE(asdecimal = False))
-            _focalLength35 = Column('focalLength35', mysql.DOUBLE(asdecimal = False))
-            _exposureTime = Column('exposureTime', mysql.DOUBLE(asdecimal = False))
-            _subjectDistance = Column('subjectDistance', mysql.DOUBLE(asdecimal = False))
+            _aperture = Column('aperture', mysql_double)
+            _focalLength = Column('focalLength', mysql_double)
+            _focalLength35 = Column('focalLength35', mysql_double)
+            _exposureTime = Column('exposureTime', mysql_double)
+            _subjectDistance = Column('subjectDistance', mysql_double)
         
         @property
         def make(self) -> Optional[str]:
@@ -425,14 +465,20 @@ def define_image_helper_tables(container: 'Images'):        # noqa: F821, C901
             """The image's exposure program (read-only)"""
             if self._exposureProgram is None:
                 return None
-            return ExposureProgram(self._exposureProgram)
+            return _to_enum(
+                _exposure_program_lookup,
+                ExposureProgram,
+                self._exposureProgram
+            )
         
         @property
         def exposureMode(self) -> Optional[ExposureMode]:
             """The image's exposure mode (read-only)"""
             if self._exposureMode is None:
                 return None
-            return ExposureMode(self._exposureMode)
+            return _to_enum(
+                _exposure_mode_lookup, ExposureMode, self._exposureMode
+            )
         
         @property
         def sensitivity(self) -> Optional[int]:
@@ -444,6 +490,8 @@ def define_image_helper_tables(container: 'Images'):        # noqa: F821, C901
             """Information about flash usage"""
             if self._flash is None:
                 return None
+            if 0 <= self._flash < 256:
+                return _flash_cache[self._flash]
             return Flash(self._flash)
         
         @property
@@ -451,7 +499,9 @@ def define_image_helper_tables(container: 'Images'):        # noqa: F821, C901
             """White balance mode"""
             if self._whiteBalance is None:
                 return None
-            return WhiteBalance(self._whiteBalance)
+            return _to_enum(
+                _white_balance_lookup, WhiteBalance, self._whiteBalance
+            )
         
         @property
         def whiteBalanceColorTemperature(self) -> Optional[int]:
@@ -463,7 +513,9 @@ def define_image_helper_tables(container: 'Images'):        # noqa: F821, C901
             """The image's metering mode"""
             if self._meteringMode is None:
                 return None
-            return MeteringMode(self._meteringMode)
+            return _to_enum(
+                _metering_mode_lookup, MeteringMode, self._meteringMode
+            )
         
         @property
         def subjectDistance(self) -> Optional[float]:
@@ -475,7 +527,11 @@ def define_image_helper_tables(container: 'Images'):        # noqa: F821, C901
             """Exif SubjectDistanceRange attribute"""
             if self._subjectDistanceCategory is None:
                 return None
-            return SubjectDistanceRange(self._subjectDistanceCategory)
+            return _to_enum(
+                _subject_distance_range_lookup,
+                SubjectDistanceRange,
+                self._subjectDistanceCategory
+            )
     
         @validates(
             '_exposureMode', '_exposureProgram',
@@ -485,8 +541,10 @@ def define_image_helper_tables(container: 'Images'):        # noqa: F821, C901
             '_whiteBalance'
         )
         def _convert_to_int(self, key: str, value: int):
-            return int(value)
+            return value if type(value) is int else int(value)
         
+    double = mysql_double if dk.is_mysql else Float
+    
     class ImagePosition(dk.base):
         """
         Contains the Image's position.
@@ -497,34 +555,16 @@ def define_image_helper_tables(container: 'Images'):        # noqa: F821, C901
         
         # Retrieve double as float
         if dk.is_mysql:
-            _latitudeNumber = Column(
-                'latitudeNumber',
-                mysql.DOUBLE(asdecimal = False)
-            )
-            _longitudeNumber = Column(
-                'longitudeNumber',
-                mysql.DOUBLE(asdecimal = False)
-            )
-            _altitude = Column(
-                'altitude',
-                mysql.DOUBLE(asdecimal = False)
-            )
-            _orientation = Column(
-                'orientation',
-                mysql.DOUBLE(asdecimal = False)
-            )
-            _tilt = Column(
-                'tilt',
-                mysql.DOUBLE(asdecimal = False)
-            )
-            _roll = Column(
-                'roll',
-                mysql.DOUBLE(asdecimal = False)
-            )
-            _accuracy = Column(
-                'accuracy',
-                mysql.DOUBLE(asdecimal = False)
-            )
+            _latitudeNumber = Column('latitudeNumber', mysql_double)
+            _longitudeNumber = Column('longitudeNumber', mysql_double)
+            _altitude = Column('altitude', mysql_double)
+        
+        # Not used by Image.position, loaded on first access
+        _orientation = deferred(Column('orientation', double))
+        _tilt = deferred(Column('tilt', double))
+        _roll = deferred(Column('roll', double))
+        _accuracy = deferred(Column('accuracy', double))
+        _description = deferred(Column('description', String))
     
     class ImageProperty(dk.base):
         """
@@ -536,7 +576,7 @@ def define_image_helper_tables(container: 'Images'):        # noqa: F821, C901
         __tablename__ = 'ImageProperties'
         
         _imageid = Column('imageid', Integer, primary_key = True)
-        _property = Column('property', String, primary_key = True)
+        _property = Column('property', interned_string, primary_key = True)
     
     class VideoMetadata(dk.base):
         """
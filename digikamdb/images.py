@@ -8,13 +8,16 @@ Digikam images can be accessed via the ``Digikam`` property
 import logging
 import os
 from datetime import datetime
-from itertools import groupby
-from typing import Iterable, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+)
 
-from sqlalchemy import Column, Integer, String, delete, text
-from sqlalchemy.orm import relationship, validates
+from sqlalchemy import Column, Integer, String, delete, select, text, update
+from sqlalchemy.orm import raiseload, relationship, selectinload, validates
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 
-from .table import DigikamTable
+from .table import DigikamTable, sqlite_datetime
 from .properties import BasicProperties
 from .image_comments import ImageCaptions, ImageTitles
 from .image_helpers import ImageCopyright, ImageProperties, define_image_helper_tables
@@ -25,13 +28,67 @@ from .exceptions import DigikamVersionError
 log = logging.getLogger(__name__)
 
 
+def _parse_coordinate(
+    value: Union[float, str],
+    pos: str,
+    neg: str
+) -> Tuple[float, str]:
+    """
+    Converts a latitude or longitude to Digikam's representations.
+    
+    Args:
+        value:  Signed float, stringified float or string containing the
+                absolute value followed by ``pos`` or ``neg``
+        pos:    Suffix for positive values (``N`` or ``E``)
+        neg:    Suffix for negative values (``S`` or ``W``)
+    Returns:
+        Tuple containing the signed float value and the string
+        representation (degrees, minutes and direction).
+    """
+    if isinstance(value, str):
+        if value[-1] == pos:
+            value = float(value[:-1])
+        elif value[-1] == neg:
+            value = - float(value[:-1])
+        else:
+            value = float(value)
+    
+    absval = abs(value)
+    deg = int(absval)
+    return value, '%d,%.8f%s' % (
+        deg,
+        (absval - deg) * 60,
+        neg if value < 0 else pos
+    )
+
+
+def _position_values(pos: Tuple) -> Dict[str, Any]:
+    """
+    Converts a position to column values for ``ImagePositions``.
+    
+    Args:
+        pos:    Tuple with latitude, longitude and optional altitude, as
+                accepted by :attr:`Image.position <_sqla.Image.position>`
+    Returns:
+        Dict mapping the mapped column names to their values. ``_altitude``
+        is only contained if ``pos`` has an altitude.
+    """
+    lat, latstr = _parse_coordinate(pos[0], 'N', 'S')
+    lng, lngstr = _parse_coordinate(pos[1], 'E', 'W')
+    values = dict(
+        _latitude = latstr,
+        _longitude = lngstr,
+        _latitudeNumber = lat,
+        _longitudeNumber = lng)
+    if len(pos) > 2:
+        values['_altitude'] = pos[2]
+    return values
+
+
 def _image_class(dk: 'Digikam') -> type:                    # noqa: F821, C901
     """
     Returns the Image class.
     """
-    if not dk.is_mysql:
-        from sqlalchemy.dialects import sqlite
-    
     class Image(dk.base):
         """
         Represents a row in the table ``Images``.
@@ -59,9 +116,7 @@ def _image_class(dk: 'Digikam') -> type:                    # noqa: F821, C901
         if not dk.is_mysql:
             _modificationDate = Column(
                 'modificationDate',
-                sqlite.DATETIME(
-                    storage_format = '%(year)04d-%(month)02d-%(day)02dT%(hour)02d:%(minute)02d:%(second)02d',   # noqa: E501
-                    regexp = r'(\d+)-(\d+)-(\d+)T(\d+):(\d+):(\d+)')
+                sqlite_datetime
             )
         
         _albumObj = relationship(
@@ -145,9 +200,11 @@ def _image_class(dk: 'Digikam') -> type:                    # noqa: F821, C901
             default caption, you can also use the :attr:`caption` property.
             See :class:`Captions` for a more detailed description.
             """
-            if not hasattr(self, '_captionsObj'):
+            try:
+                return self._captionsObj
+            except AttributeError:
                 self._captionsObj = ImageCaptions(self)
-            return self._captionsObj
+                return self._captionsObj
         
         @property
         def caption(self) -> Optional[str]:
@@ -187,9 +244,11 @@ def _image_class(dk: 'Digikam') -> type:                    # noqa: F821, C901
             ``titles['']`` or ``titles[None]`` will return the default
             language (**x-default**)
             """
-            if not hasattr(self, '_titlesObj'):
+            try:
+                return self._titlesObj
+            except AttributeError:
                 self._titlesObj = ImageTitles(self)
-            return self._titlesObj
+                return self._titlesObj
         
         @property
         def title(self) -> str:
@@ -211,9 +270,11 @@ def _image_class(dk: 'Digikam') -> type:                    # noqa: F821, C901
             """
             The image's copyright data (no setter)
             """
-            if not hasattr(self, '_copyrightObj'):
+            try:
+                return self._copyrightObj
+            except AttributeError:
                 self._copyrightObj = ImageCopyright(self)
-            return self._copyrightObj
+                return self._copyrightObj
         
         # Relationship to ImageHistory
         
@@ -277,62 +338,25 @@ def _image_class(dk: 'Digikam') -> type:                    # noqa: F821, C901
                 pos
             )
             if pos is None:
-                if self._position:
-                    self._session.execute(
-                        delete(self.digikam.images.ImagePosition)
-                        .filter_by(_imageid = self.id))
+                # No need to check if a position exists
+                self._session.execute(
+                    delete(self.digikam.images.ImagePosition)
+                    .filter_by(_imageid = self.id))
+                set_committed_value(self, '_position', None)
                 return
             
-            lat = pos[0]
-            lng = pos[1]
-            
-            if isinstance(lat, str):
-                if lat[-1] == 'N':
-                    lat = float(lat[:-1])
-                elif lat[-1] == 'S':
-                    lat = - float(lat[:-1])
-                else:
-                    lat = float(lat)
-
-            if isinstance(lng, str):
-                if lng[-1] == 'E':
-                    lng = float(lng[:-1])
-                elif lng[-1] == 'W':
-                    lng = - float(lng[:-1])
-                else:
-                    lng = float(lng)
-            
-            if lat < 0:
-                lat2 = -lat
-                latstr = '%d,%.8fS' % (int(lat2), (lat2-int(lat2))*60)
-            else:
-                latstr = '%d,%.8fN' % (int(lat), (lat-int(lat))*60)
-            if lng < 0:
-                lng2 = -lng
-                lngstr = '%d,%.8fW' % (int(lng2), (lng2-int(lng2))*60)
-            else:
-                lngstr = '%d,%.8fE' % (int(lng), (lng-int(lng))*60)
-            
+            values = _position_values(pos)
             if self._position:
-                self._position._latitude = latstr
-                self._position._longitude = lngstr
-                self._position._latitudeNumber = lat
-                self._position._longitudeNumber = lng
-                if len(pos) > 2:
-                    self._position._altitude = pos[2]
+                # One UPDATE, the loaded row is synchronized by the session
+                self._session.execute(
+                    update(self.digikam.images.ImagePosition)
+                    .filter_by(_imageid = self.id)
+                    .values(**values))
             else:
-                alt = None
-                if len(pos) > 2:
-                    alt = pos[2]
-                newpos = self.digikam.images.ImagePosition(
+                values.setdefault('_altitude', None)
+                self._position = self.digikam.images.ImagePosition(
                     _imageid = self.id,
-                    _latitude = latstr,
-                    _longitude = lngstr,
-                    _latitudeNumber = lat,
-                    _longitudeNumber = lng,
-                    _altitude = alt)
-                self._session.add(newpos)
-#            self._session.commit()
+                    **values)
         
         # Relationship to ImageProperties
         
@@ -344,9 +368,11 @@ def _image_class(dk: 'Digikam') -> type:                    # noqa: F821, C901
             See :class:`~_sqla.ImageProperties` for more information.
             """
             
-            if not hasattr(self, '_propertiesObj'):
+            try:
+                return self._propertiesObj
+            except AttributeError:
                 self._propertiesObj = ImageProperties(self)
-            return self._propertiesObj
+                return self._propertiesObj
         
         # Relationship to Tags
         
@@ -447,11 +473,11 @@ def _image_class(dk: 'Digikam') -> type:                    # noqa: F821, C901
             """
             if self._album is None:
                 return None
-            else:
-                return os.path.join(
-                    self.album.abspath,
-                    self.name if self.album.root.caseSensitivity else self.name.lower()
-                )
+            album = self.album
+            return os.path.join(
+                album.abspath,
+                self.name if album.root.caseSensitivity else self.name.lower()
+            )
 
     return Image
         
@@ -483,6 +509,17 @@ class Images(DigikamTable):
     
     _class_function = _image_class
     
+    #: Relationships that can be loaded by :meth:`select_with`
+    _preloadable = {
+        'album':        '_albumObj',
+        'history':      '_history',
+        'imagemeta':    '_metadata',
+        'information':  '_information',
+        'position':     '_position',
+        'tags':         '_tags',
+        'videometa':    '_videometadata',
+    }
+    
     def __init__(
         self,
         digikam: 'Digikam',                                  # noqa: F821
@@ -490,6 +527,233 @@ class Images(DigikamTable):
         super().__init__(digikam)
         define_image_helper_tables(self)
     
+    def select_with(
+        self,
+        *relations: str,
+        strict: bool = False,
+        **kwargs
+    ) -> Union['~sqlalchemy.orm.Query', List['Image']]:     # noqa: F821
+        """
+        Selects images with some of their related objects loaded in bulk.
+        
+        Accessing e.g. :attr:`Image.information <_sqla.Image.information>`
+        issues one ``SELECT`` per image. With this method, the given
+        relations are loaded with one additional query for all images:
+        
+        .. code-block:: python
+            
+            for img in dk.images.select_with('information', 'position'):
+                print(img.name, img.information.rating, img.position)
+        
+        Supported relations are ``album``, ``history``, ``imagemeta``,
+        ``information``, ``position``, ``tags`` and ``videometa``. Captions
+        and titles can be loaded with :meth:`preload_captions` and
+        :meth:`preload_titles`.
+        
+        With ``strict = True``, accessing any other relation of the returned
+        images raises an exception instead of emitting a ``SELECT``. This
+        helps to find relations missing in ``relations`` during development.
+        As the exceptions would persist on the loaded objects, strict mode
+        loads the images in a separate, short-lived session and returns them
+        as a list. The images are detached from any session: the loaded
+        columns and relations can be read, accessing other relations raises
+        :exc:`~sqlalchemy.orm.exc.DetachedInstanceError`. They are not the
+        same objects as those returned by e.g. :meth:`select`, and changes
+        to them are not saved.
+        
+        Args:
+            relations:  Names of the :class:`~_sqla.Image` properties to load.
+            strict:     Raise an exception when other relations are loaded.
+            kwargs:     Columns to check for equality, as in :meth:`select`.
+        Returns:
+            Iterable query yielding the images, or a list of read-only
+            images if ``strict`` is set.
+        Raises:
+            ValueError:     Relation cannot be loaded in bulk.
+        
+        .. versionadded:: 0.3.6
+        """
+        query = self._select(**kwargs)
+        for rel in relations:
+            try:
+                attr = getattr(self.Class, self._preloadable[rel])
+            except KeyError:
+                raise ValueError('Cannot preload %s' % rel)
+            query = query.options(selectinload(attr))
+        if strict:
+            # Keep the raiseload options away from the shared identity map
+            with self.digikam.session_scope() as session:
+                return query.with_session(session).options(
+                    raiseload('*', sql_only = True)
+                ).all()
+        return query
+    
+    def _select_comments(
+        self,
+        image_ids: Sequence[int],
+        type_: int,
+        *columns: str
+    ) -> Iterable[Tuple]:
+        """
+        Selects columns from the comments of type ``type_`` for multiple images.
+        
+        Only the image id and the given columns are selected, no
+        ``ImageComment`` objects are created. The ids are split into chunks to
+        keep the number of SQL parameters small, and the rows are streamed
+        from the database.
+        
+        Yields:
+            Tuples with the image id and the given columns.
+        """
+        cls = self.ImageComment
+        stmt = select(
+            cls._imageid,
+            *(getattr(cls, col) for col in columns)
+        ).where(
+            cls._type == type_
+        ).execution_options(yield_per = self._chunk_size)
+        for chunk in self._chunks(image_ids):
+            yield from self._session.execute(
+                stmt.where(cls._imageid.in_(chunk))
+            )
+    
+    def preload_titles(
+        self,
+        image_ids: Sequence[int]
+    ) -> Dict[int, Dict[str, str]]:
+        """
+        Returns the titles of multiple images.
+        
+        Reading :attr:`Image.titles <_sqla.Image.titles>` issues at least one
+        query per image. This method loads the titles of all given images
+        with one query.
+        
+        Args:
+            image_ids:  The images' ids.
+        Returns:
+            A dict mapping each image id to a dict containing the image's
+            titles, with the same keys and values as
+            :meth:`ImageTitles.items() <digikamdb.image_comments.ImageTitles>`.
+        
+        .. versionadded:: 0.3.6
+        """
+        ret = { id_: {} for id_ in image_ids }
+        for id_, language, comment in self._select_comments(
+            image_ids, ImageTitles._comment_type, '_language', '_comment'
+        ):
+            ret[id_][language] = comment
+        return ret
+    
+    def preload_captions(
+        self,
+        image_ids: Sequence[int]
+    ) -> Dict[int, Dict[Tuple, Tuple]]:
+        """
+        Returns the captions of multiple images.
+        
+        Works like :meth:`preload_titles`. The keys of the inner dicts are
+        (language, author) tuples, the values (caption, date) tuples.
+        
+        Args:
+            image_ids:  The images' ids.
+        Returns:
+            A dict mapping each image id to a dict containing the image's
+            captions.
+        
+        .. versionadded:: 0.3.6
+        """
+        ret = { id_: {} for id_ in image_ids }
+        for id_, language, author, comment, date in self._select_comments(
+            image_ids,
+            ImageCaptions._comment_type,
+            '_language', '_author', '_comment', '_date'
+        ):
+            ret[id_][(language, author)] = (comment, date)
+        return ret
+    
+    def set_positions(
+        self,
+        positions: Union[
+            Mapping[int, Optional[Tuple]],
+            Iterable[Tuple[int, Optional[Tuple]]]
+        ]
+    ):
+        """
+        Sets the positions of multiple images.
+        
+        Setting :attr:`Image.position <_sqla.Image.position>` issues at
+        least one query per image. This method checks which images already
+        have a position with one query per 500 images, and then inserts,
+        updates and deletes the rows in bulk:
+        
+        .. code-block:: python
+            
+            dk.images.set_positions({
+                42: (50.1096, 8.7029),
+                43: ('50.1109N', '8.6684E', 612),
+                44: None,                           # remove position
+            })
+            dk.session.commit()
+        
+        Args:
+            positions:  Dict or iterable of (image id, position) pairs. The
+                        positions are given as for :attr:`Image.position
+                        <_sqla.Image.position>`, ``None`` removes the
+                        position.
+        
+        .. versionadded:: 0.3.6
+        """
+        cls = self.ImagePosition
+        if isinstance(positions, Mapping):
+            positions = positions.items()
+        
+        # The last entry for an image wins
+        rows = {}
+        remove = set()
+        for id_, pos in positions:
+            if pos is None:
+                remove.add(id_)
+                rows.pop(id_, None)
+            else:
+                remove.discard(id_)
+                rows[id_] = dict(_imageid = id_, **_position_values(pos))
+        remove = list(remove)
+        
+        ids = list(rows)
+        existing = set()
+        for chunk in self._chunks(ids):
+            existing.update(self._session.scalars(
+                select(cls._imageid).where(cls._imageid.in_(chunk))
+            ))
+        
+        new_rows = []
+        changed_rows = []
+        for id_, row in rows.items():
+            if id_ in existing:
+                changed_rows.append(row)
+            else:
+                row.setdefault('_altitude', None)
+                new_rows.append(row)
+        
+        if new_rows:
+            self._session.bulk_insert_mappings(cls, new_rows)
+        if changed_rows:
+            self._session.bulk_update_mappings(cls, changed_rows)
+        for chunk in self._chunks(remove):
+            self._session.execute(
+                delete(cls).where(cls._imageid.in_(chunk))
+            )
+        
+        # Bulk statements bypass objects already loaded in the session
+        identity_map = self._session.identity_map
+        for id_ in ids + remove:
+            img = identity_map.get(identity_key(self.Class, id_))
+            if img is not None:
+                self._session.expire(img, ['_position'])
+            row = identity_map.get(identity_key(cls, id_))
+            if row is not None:
+                self._session.expire(row)
+    
     def find(
         self,
         path: Union[str, bytes, os.PathLike]
@@ -512,11 +776,16 @@ class Images(DigikamTable):
         
         albums = self.digikam.albums.find(abspath)
         if albums:
-            ret = []
-            for al in albums:
-                log.debug('Adding images from album %s to result', al.abspath)
-                ret.extend(al.images.all())
-            return ret
+            log.debug('Adding images from %d albums to result', len(albums))
+            # Select the images of all albums at once, keep the albums' order
+            ids = [al.id for al in albums]
+            by_album = { id_: [] for id_ in ids }
+            for chunk in self._chunks(ids):
+                for img in self._select().filter(
+                    self.Class._album.in_(chunk)
+                ):
+                    by_album[img._album].append(img)
+            return [img for id_ in ids for img in by_album[id_]]
         
         # There are no albums on path, so path must 
         # be an image file if it exists.
@@ -530,4 +799,59 @@ class Images(DigikamTable):
         
         log.debug('No files found')
         return []
+    
+    def find_many(
+        self,
+        paths: Iterable[Union[str, os.PathLike]]
+    ) -> Dict[Union[str, os.PathLike], List['Image']]:     # noqa: F821
+        """
+        Finds multiple image files.
+        
+        Calling :meth:`find` for many files issues several queries per file.
+        This method looks up each directory's album once and selects all
+        images with as few queries as possible. Unlike :meth:`find`, it does
+        not return the images contained in a directory.
+        
+        File names are compared like :meth:`find` does it in the database:
+        exactly with SQLite, and ignoring case with MySQL (as with MySQL's
+        default collations).
+        
+        Args:
+            paths:  Paths to image files. Can be given as any type that the
+                    :mod:`os.path` functions understand.
+        Returns:
+            A dict mapping each path to a list of the matching images (usually
+            containing one or no element).
+        
+        .. versionadded:: 0.3.6
+        """
+        if self._is_mysql:
+            normalize = str.lower
+        else:
+            normalize = str
+        
+        albums = {}
+        wanted = {}
+        for path in paths:
+            dir_, base = os.path.split(os.path.abspath(path))
+            if dir_ not in albums:
+                albums[dir_] = self.digikam.albums.find(dir_, True)
+            album = albums[dir_]
+            wanted[path] = (album.id, normalize(base)) if album else None
+        
+        # Dict (album id, normalized name) -> {image id: image}
+        found = { key: {} for key in wanted.values() if key }
+        for chunk in self._chunks(found):
+            for img in self._select().filter(
+                self.Class._album.in_(set(k[0] for k in chunk)),
+                self.Class._name.in_(set(k[1] for k in chunk))
+            ):
+                key = (img._album, normalize(img.name))
+                if key in found:
+                    found[key][img.id] = img
+        
+        return {
+            path: list(found[key].values()) if key else []
+            for path, key in wanted.items()
+        }
 
@@ -3,7 +3,7 @@
 import logging
 from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
-from sqlalchemy.orm.exc import NoResultFound, MultipleResultsFound
+from sqlalchemy.orm.exc import MultipleResultsFound
 
 from .table import DigikamTable
 from .exceptions import DigikamObjectNotFoundError, DigikamMultipleObjectsFoundError
@@ -87,21 +87,18 @@ class BasicProperties(DigikamTable):
     def __getitem__(self, prop: Union[str, int, Sequence]) -> str:  # noqa: F821
         """[] operator"""
         try:
-            if self._raise_on_not_found:
-                ret = self._select_prop(prop).one()
-            else:
-                ret = self._select_prop(prop).one_or_none()
-                if ret is None:
-                    log.debug('No record found, returning None')
-                    return None
-        except NoResultFound:
-            raise DigikamObjectNotFoundError('No %s object for %s=%s' % (
-                self.Class.__name__, self._id_column, prop
-            ))
+            ret = self._select_prop(prop).one_or_none()
         except MultipleResultsFound:                        # pragma: no cover
             raise DigikamMultipleObjectsFoundError('Multiple %s objects for %s=%s' % (
                 self.Class.__name__, self._id_column, prop
             ))
+        if ret is None:
+            if self._raise_on_not_found:
+                raise DigikamObjectNotFoundError('No %s object for %s=%s' % (
+                    self.Class.__name__, self._id_column, prop
+                ))
+            log.debug('No record found, returning None')
+            return None
         return self._post_process_value(ret)
     
     def __setitem__(
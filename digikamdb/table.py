@@ -2,23 +2,96 @@
 Basic Digikam Table Class
 """
 
+import datetime
 import logging
 import re
-from typing import Any, Iterable, Mapping, Optional, Union
+import sys
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
-from sqlalchemy import delete, inspect, text
-from sqlalchemy.orm.exc import NoResultFound, MultipleResultsFound
+from sqlalchemy import String, TypeDecorator, delete, inspect, select, text
+from sqlalchemy.dialects import mysql
+from sqlalchemy.engine import Dialect
 
 from .exceptions import (
     DigikamError,
     DigikamObjectNotFoundError,
-    DigikamMultipleObjectsFoundError,
     DigikamDataIntegrityError
 )
 
 log = logging.getLogger(__name__)
 
 
+class SQLiteDateTime(TypeDecorator):
+    """
+    DATETIME type for SQLite, stored as ISO 8601 text
+    
+    Digikam stores dates in SQLite as ``YYYY-MM-DDTHH:MM:SS``, sometimes
+    followed by milliseconds. Values are parsed with
+    :meth:`datetime.datetime.fromisoformat` instead of SQLAlchemy's regular
+    expression based parser, ignoring anything after the seconds. Values are
+    stored with seconds precision, too.
+    
+    .. versionadded:: 0.3.6
+    """
+    
+    impl = String
+    cache_ok = True
+    
+    def process_bind_param(
+        self,
+        value: Optional[datetime.date],
+        dialect: Dialect
+    ) -> Optional[str]:
+        if value is None:
+            return None
+        if not isinstance(value, datetime.datetime):
+            value = datetime.datetime.combine(value, datetime.time())
+        return value.isoformat(timespec = 'seconds')
+    
+    def process_result_value(
+        self,
+        value: Optional[str],
+        dialect: Dialect
+    ) -> Optional[datetime.datetime]:
+        if value is None:
+            return None
+        return datetime.datetime.fromisoformat(value[:19])
+
+
+class InternedString(TypeDecorator):
+    """
+    String type returning interned strings
+    
+    Used for columns with few distinct values repeated in many rows, like
+    languages or property names. All rows share the same string objects,
+    and comparisons between them are identity checks.
+    
+    .. versionadded:: 0.3.6
+    """
+    
+    impl = String
+    cache_ok = True
+    
+    def process_result_value(
+        self,
+        value: Optional[str],
+        dialect: Dialect
+    ) -> Optional[str]:
+        if value is None:
+            return None
+        return sys.intern(value)
+
+
+#: Type for DATETIME columns in SQLite databases, shared by all table classes
+sqlite_datetime = SQLiteDateTime()
+
+#: Type for string columns with few distinct values
+interned_string = InternedString()
+
+#: Type for MySQL DOUBLE columns, retrieving the values as float
+mysql_double = mysql.DOUBLE(asdecimal = False)
+
+
 class DigikamTable:
     """
     An abstract base class for table classes
@@ -37,9 +110,15 @@ class DigikamTable:
     #: Function returning the corresponding mapped class
     _class_function = None
     
-    #: ID column
+    #: ID column (must be the primary key)
     _id_column = '_id'
     
+    #: Number of rows fetched at once by :meth:`select_columns`
+    _yield_per = 1000
+    
+    #: Maximum number of ids in a query for multiple rows, see :meth:`_chunks`
+    _chunk_size = 500
+    
     #: Raise an Exception when ``[]`` does not find a suitable row.
     #: Otherwise, ``None`` is returned.
     _raise_on_not_found = True
@@ -68,25 +147,42 @@ class DigikamTable:
         yield from self._select()
     
     def __contains__(self, key: str) -> bool:
-        kwargs = { self._id_column: key }
-        return self._select(**kwargs).one_or_none() is not None
+        return self._get(key) is not None
     
     def __getitem__(self, key: Any) -> 'DigikamObject':     # noqa: F821
-        kwargs = { self._id_column: key }
-        try:
-            if self._raise_on_not_found:
-                return self._select(**kwargs).one()
-            else:                                           # pragma: no cover
-                # This will not happen now, but we keep it for safety
-                return self._select(**kwargs).one_or_none()
-        except NoResultFound:
+        ret = self._get(key)
+        if ret is None and self._raise_on_not_found:
             raise DigikamObjectNotFoundError('No %s object for %s=%s' % (
                 self.Class.__name__, self._id_column, key
             ))
-        except MultipleResultsFound:                        # pragma: no cover
-            raise DigikamMultipleObjectsFoundError('Multiple %s objects for %s=%s' % (
-                self.Class.__name__, self._id_column, key
-            ))
+        return ret
+    
+    @classmethod
+    def _chunks(cls, seq: Iterable) -> Iterator[List]:
+        """
+        Splits ``seq`` into lists of at most :attr:`_chunk_size` elements.
+        
+        Used for ``IN`` clauses with many values, to keep the number of SQL
+        parameters below the database's limit.
+        """
+        seq = list(seq)
+        for i in range(0, len(seq), cls._chunk_size):
+            yield seq[i:i + cls._chunk_size]
+    
+    def _get(self, key: Any) -> Optional['DigikamObject']:  # noqa: F821
+        """
+        Returns the object with the given id, or ``None``.
+        
+        Uses :meth:`~sqlalchemy.orm.Session.get`, so no query is issued
+        when the object is already present in the session. Objects marked
+        for deletion but not yet flushed are not returned.
+        """
+        if key is None:
+            return None
+        obj = self._session.get(self.Class, key)
+        if obj is not None and obj in self._session.deleted:
+            return None
+        return obj
     
     def select(
         self,
@@ -128,6 +224,39 @@ class DigikamTable:
             query = query.filter(text(txt))
         return query
     
+    def select_columns(self, *columns: str, **kwargs) -> Iterable[Tuple]:
+        """
+        Returns the values of some columns as tuples.
+        
+        Unlike :meth:`select`, this method does not create mapped objects, so
+        it is much faster when reading many rows. The rows are fetched from the
+        database in chunks.
+        
+        Column names can be given with or without the ``_`` prefix. Keyword
+        arguments are used as ``WHERE`` clauses checking for equality, like in
+        :meth:`select`.
+        
+        Args:
+            columns:    Names of the columns to return
+            kwargs:     Columns to check for equality
+        Returns:
+            Iterable yielding tuples with the given columns' values.
+        
+        .. versionadded:: 0.3.6
+        """
+        if not columns:
+            raise ValueError('At least one column must be given')
+        stmt = select(*(
+            getattr(self.Class, col if col.startswith('_') else '_' + col)
+            for col in columns
+        ))
+        kwargs = self._underscore_kwargs(kwargs)
+        if kwargs:
+            stmt = stmt.filter_by(**kwargs)
+        return self._session.execute(
+            stmt.execution_options(yield_per = self._yield_per)
+        )
+    
     @staticmethod
     def _underscore_kwargs(kwargs: Mapping) -> Mapping:
         ret = {}
@@ -246,9 +246,11 @@ def _tag_class(dk: 'Digikam') -> type:                      # noqa: F821, C901
             """
             Returns the tag's properties
             """
-            if not hasattr(self, '_propertiesObj'):
+            try:
+                return self._propertiesObj
+            except AttributeError:
                 self._propertiesObj = TagProperties(self)
-            return self._propertiesObj
+                return self._propertiesObj
         
         def hierarchicalname(self) -> str:
             """
@@ -223,6 +223,11 @@ class ExifFlashMode(ExifEnum):
         return _exif_flash_mode_str_value[int(self)]
 
 
+# Members indexed by value, for ExifFlash
+_exif_flash_returns = tuple(ExifFlashReturn)
+_exif_flash_modes = tuple(ExifFlashMode)
+
+
 class ExifFlash:
     """
     Exif Flash Tag
@@ -241,6 +246,9 @@ class ExifFlash:
         *   ``__repr__`` shows the fields' names
         *   More readable ``__str__``
     """
+    
+    __slots__ = ('_value',)
+    
     def __init__(
         self,
         value: Union[int, Mapping]
@@ -248,17 +256,14 @@ class ExifFlash:
         if isinstance(value, int):
             self._value = value
         elif isinstance(value, dict):
-            self._value = 0
-            if 'flash_fired' in value and value['flash_fired']:
-                self._value |= 1
-            if 'flash_return' in value and value['flash_return']:
-                self._value |= (value['flash_return'] << 1)
-            if 'flash_mode' in value and value['flash_mode']:
-                self._value |= (value['flash_mode'] << 3)
-            if 'no_flash_function' in value and value['no_flash_function']:
-                self._value |= 32
-            if 'red_eye_reduction' in value and value['red_eye_reduction']:
-                self._value |= 64
+            get = value.get
+            self._value = (
+                (1 if get('flash_fired') else 0)
+                | ((get('flash_return') or 0) << 1)
+                | ((get('flash_mode') or 0) << 3)
+                | (32 if get('no_flash_function') else 0)
+                | (64 if get('red_eye_reduction') else 0)
+            )
         else:
             raise TypeError('Flash constructor Argument must be int or dict')
     
@@ -311,12 +316,12 @@ class ExifFlash:
     @property
     def flash_return(self) -> ExifFlashReturn:
         """Status of returned light"""
-        return ExifFlashReturn((self._value >> 1) & 3)
+        return _exif_flash_returns[(self._value >> 1) & 3]
     
     @property
     def flash_mode(self) -> ExifFlashMode:
         """Flash mode"""
-        return ExifFlashMode((self._value >> 3) & 3)
+        return _exif_flash_modes[(self._value >> 3) & 3]
     
     @property
     def no_flash_function(self) -> bool:
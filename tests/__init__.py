@@ -2,9 +2,14 @@
 import logging
 import logging.handlers
 import os
+from datetime import date, datetime
 from unittest import TestCase, skip     # noqa: F401
 
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import InvalidRequestError
+
 from digikamdb import Digikam
+from digikamdb.table import sqlite_datetime
 
 # Run the digikamrc tests first
 from .digikamrc import (                                    # noqa: F401
@@ -55,4 +60,48 @@ class aBasicTests(TestCase):
     def test_10_constructor(self):
         with self.assertRaises(TypeError):
             self.dk = Digikam(1)
+    
+    def test_20_failed_setup(self):
+        # Database containing only the Settings table
+        engine = create_engine('sqlite://')
+        with engine.begin() as conn:
+            conn.execute(text(
+                'CREATE TABLE Settings (keyword TEXT NOT NULL UNIQUE, value TEXT)'
+            ))
+            conn.execute(text(
+                "INSERT INTO Settings VALUES ('DBVersion', '16')"
+            ))
+        dk = Digikam(engine)
+        # Setup must fail on each access, not only on the first one
+        for _ in range(2):
+            with self.assertRaises(InvalidRequestError):
+                _ = dk.images
+        dk.destroy()
+    
+    def test_30_sqlite_datetime(self):
+        # Seconds precision like Digikam, fractions and time zones are ignored
+        self.assertEqual(
+            sqlite_datetime.process_result_value(
+                '2022-06-11T14:56:44.370', None
+            ),
+            datetime(2022, 6, 11, 14, 56, 44)
+        )
+        self.assertEqual(
+            sqlite_datetime.process_result_value(
+                '2022-06-11T14:56:44+02:00', None
+            ),
+            datetime(2022, 6, 11, 14, 56, 44)
+        )
+        self.assertIsNone(sqlite_datetime.process_result_value(None, None))
+        self.assertEqual(
+            sqlite_datetime.process_bind_param(
+                datetime(2022, 6, 11, 14, 56, 44, 370000), None
+            ),
+            '2022-06-11T14:56:44'
+        )
+        self.assertEqual(
+            sqlite_datetime.process_bind_param(date(2022, 6, 11), None),
+            '2022-06-11T00:00:00'
+        )
+        self.assertIsNone(sqlite_datetime.process_bind_param(None, None))
 
@@ -4,9 +4,11 @@ from shutil import copyfile, rmtree, unpack_archive
 from subprocess import run, CalledProcessError
 from tempfile import mkdtemp
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import NoResultFound    # noqa: F401
 
 from digikamdb import *                                     # noqa: F403
+from digikamdb.conn import _mysql_url, _read_digikamrc
 
 from .base import DigikamTestBase
 
@@ -105,6 +107,43 @@ class DigikamRCTest(DigikamTestBase):
         for al in self.dk.albums:
             self.assertIsInstance(al.relativePath, str)
     
+    def test_rc_mysql_url(self):
+        password = 'p@ss:w/rd%'
+        configfile = os.path.join(self.home, '.config', 'digikamrc')
+        with open(
+            os.path.join(self.datadir, 'digikamrc.mysql'),
+            'r'
+        ) as infile:
+            with open(configfile, 'w') as outfile:
+                for line in infile.readlines():
+                    outfile.write(
+                        line
+                        .replace('@@DB_HOST@@', 'db.example.com')
+                        .replace('@@DB_USER@@', 'digikam')
+                        .replace('@@DB_PASS@@', password)
+                        .replace('@@DB_NAME@@', 'photos')
+                    )
+        
+        st = os.stat(configfile)
+        config = _read_digikamrc(configfile, st.st_mtime_ns, st.st_size)
+        url = _mysql_url(config)
+        self.assertEqual(url.drivername, 'mysql+pymysql')
+        self.assertEqual(url.host, 'db.example.com')
+        self.assertEqual(url.port, 3306)
+        self.assertEqual(url.username, 'digikam')
+        self.assertEqual(url.password, password)
+        self.assertEqual(url.database, 'photos')
+        self.assertEqual(dict(url.query), {'charset': 'utf8mb4'})
+        # Password survives rendering and parsing
+        rendered = make_url(url.render_as_string(hide_password = False))
+        self.assertEqual(rendered.password, password)
+        self.assertEqual(rendered.port, 3306)
+        
+        self.assertIsNone(_mysql_url(dict(config, db_port = '')).port)
+        self.assertIsNone(_mysql_url(dict(config, db_port = '0')).port)
+        with self.assertRaises(DigikamConfigError):
+            _mysql_url(dict(config, db_port = 'abc'))
+    
     def test_rc_mysql_internal(self):
         copyfile(
             os.path.join(self.datadir, 'digikamrc.mysql-internal'),
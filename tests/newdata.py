@@ -212,6 +212,32 @@ class NewData(NewDataRoot):
                 album = self.dk.albums[albumdata['id']]
                 self.assertIn(album, found)
                 self.assertIs(album, self.dk.albums.find(album.abspath, True))
+        
+        for rootdata in new_data['albumroots']:
+            with self.subTest(albumroot = rootdata['_idx']):
+                root = self.dk.albumRoots[rootdata['id']]
+                self.assertCountEqual(
+                    self.dk.albums.find(root.abspath),
+                    root.albums.all()
+                )
+        
+        # Overlapping roots are detected when searching for a root, too
+        root = self.dk.albumRoots[new_data['albumroots'][0]['id']]
+        nested = self.dk.albumRoots._insert(
+            label = 'Nested',
+            status = 0,
+            type = 1,
+            identifier = 'volumeid:?path=' + os.path.join(
+                root.abspath,
+                'New_Album'
+            ),
+            specificPath = '/'
+        )
+        try:
+            with self.assertRaises(DigikamDataIntegrityError):
+                self.dk.albums.find(nested.abspath)
+        finally:
+            self.dk.session.rollback()
     
     def test22_album_properties(self):
         albumdata = self.__class__.new_data['albums'][2]
@@ -331,11 +357,12 @@ class NewData(NewDataRoot):
         self._check_image(imgdata)
         img = self.dk.images[imgdata['id']]
         img.position = pos
-        self.dk.session.commit()
         if datapos is None:
             datapos = pos
         if isinstance(pos, tuple) and len(pos) == 2:
             datapos = (datapos[0], datapos[1], None)
+        self.assertEqual(img.position, datapos)
+        self.dk.session.commit()
         imgdata['position'] = datapos
         
     def test31_image_position(self):
@@ -387,6 +414,53 @@ class NewData(NewDataRoot):
             (-50.11088572429458, -8.668430363718421, 524)
         )
         self._set_image_position(imgdata, None)
+        img = self.dk.images[imgdata['id']]
+        self.assertIsNone(img.position)
+        img.position = None
+        self.assertIsNone(img.position)
+        self.dk.session.commit()
+    
+    def test33_set_positions(self):
+        new_data = self.__class__.new_data
+        imgdata0 = new_data['images'][0]
+        imgdata1 = new_data['images'][1]
+        self.assertIsNone(imgdata0['position'])
+        img0 = self.dk.images[imgdata0['id']]
+        img1 = self.dk.images[imgdata1['id']]
+        self.assertIsNone(img0.position)
+        self.assertEqual(img1.position[2], 612)
+        self.dk.images.set_positions({
+            imgdata0['id']: (48.1374, 11.5755, 519),
+            imgdata1['id']: ('48.1374N', '11.5755W'),
+        })
+        self.assertEqual(img0.position, (48.1374, 11.5755, 519))
+        self.assertEqual(img1.position, (48.1374, -11.5755, 612))
+        self.dk.images.set_positions([(imgdata0['id'], None)])
+        self.assertIsNone(img0.position)
+        # The last entry for an image wins
+        self.dk.images.set_positions([
+            (imgdata0['id'], None),
+            (imgdata0['id'], (10.0, 20.0)),
+        ])
+        self.assertEqual(img0.position, (10.0, 20.0, None))
+        self.dk.images.set_positions([
+            (imgdata0['id'], (30.0, 40.0)),
+            (imgdata0['id'], None),
+        ])
+        self.assertIsNone(img0.position)
+        self.dk.session.commit()
+        self.assertIsNone(self.dk.images[imgdata0['id']].position)
+        self.assertEqual(
+            self.dk.images[imgdata1['id']].position,
+            (48.1374, -11.5755, 612)
+        )
+        imgdata1['position'] = (48.1374, -11.5755, 612)
+        # Columns not used by Image.position are deferred
+        pos = self.dk.images[imgdata1['id']]._position
+        self.assertNotIn('_tilt', pos.__dict__)
+        self.assertNotIn('_description', pos.__dict__)
+        self.assertIsNone(pos._tilt)
+        self.assertIn('_tilt', pos.__dict__)
     
     def test34_image_copyright(self):
         new_data = self.__class__.new_data
@@ -396,10 +470,23 @@ class NewData(NewDataRoot):
         self.assertNotIn('copyrightNotice', img.copyright)
         img.copyright['creator'] = 'RCW'
         img.copyright['copyrightNotice'] = ('(c) 2022 RCW', 'x-default')
+        img.copyright['rightsUsageTerms'] = 'Nothing'
+        img.copyright['rightsUsageTerms'] = [
+            ('Free', 'x-default'),
+            ('Frei', 'de-DE'),
+        ]
         self.dk.session.commit()
+        self.assertEqual(
+            img.copyright[('rightsUsageTerms', 'Frei')],
+            ('Frei', 'de-DE')
+        )
         imgdata['copyright'] = {
             'creator':          'RCW',
             'copyrightNotice':  ('(c) 2022 RCW', 'x-default'),
+            'rightsUsageTerms': [
+                ('Free', 'x-default'),
+                ('Frei', 'de-DE'),
+            ],
         }
     
     def test35_find_images(self):
@@ -681,6 +768,10 @@ class NewData(NewDataRoot):
         tag = self.dk.tags[tagdata['id']]
         self.assertEqual(tag.name, name)
         self.dk.tags.remove(tag)
+        # Removed tag is not found before the session is flushed
+        self.assertNotIn(tagdata['id'], self.dk.tags)
+        with self.assertRaises(DigikamObjectNotFoundError):
+            _ = self.dk.tags[tagdata['id']]
         self.dk.session.commit()
         with self.assertRaises(TypeError):
             self.dk.tags.remove('New Tag XXX')
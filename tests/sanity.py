@@ -2,9 +2,12 @@
 
 import logging
 import os
+import sys
 from unittest import TestCase, skip     # noqa: F401
 
+from sqlalchemy import event, select
 from sqlalchemy.exc import NoResultFound    # noqa: F401
+from sqlalchemy.orm.exc import DetachedInstanceError
 
 from digikamdb import DigikamDataIntegrityError
 from digikamdb.types import ImageCategory
@@ -39,6 +42,25 @@ class SanityCheck:
                     os.path.commonpath([self.mydir, al.abspath]),
                     self.mydir)
     
+    def test21_albums_with_images(self):
+        albums = list(self.dk.albums)
+        found = self.dk.albums.with_images(albums)
+        self.assertEqual(list(found), albums)
+        for al, images in found.items():
+            with self.subTest(albumid = al.id):
+                self.assertEqual(
+                    sorted(img.id for img in images),
+                    sorted(img.id for img in al.images)
+                )
+    
+    def test22_find_album_images(self):
+        for al in self.dk.albums:
+            with self.subTest(albumid = al.id):
+                expected = []
+                for al2 in self.dk.albums.find(al.abspath):
+                    expected.extend(al2.images)
+                self.assertEqual(self.dk.images.find(al.abspath), expected)
+    
     def test30_images(self):
         for img in self.dk.images:
             with self.subTest(imageid = img.id):
@@ -66,6 +88,106 @@ class SanityCheck:
                 with self.subTest(imageid = img.id, tagid = tag.id):
                     self.assertIn(img, tag.images)
     
+    def test32_preload_comments(self):
+        ids = [img.id for img in self.dk.images]
+        titles = self.dk.images.preload_titles(ids)
+        captions = self.dk.images.preload_captions(ids)
+        self.assertEqual(sorted(titles), sorted(ids))
+        self.assertEqual(sorted(captions), sorted(ids))
+        for img in self.dk.images:
+            with self.subTest(imageid = img.id):
+                self.assertEqual(titles[img.id], dict(img.titles.items()))
+                self.assertEqual(captions[img.id], dict(img.captions.items()))
+    
+    def test33_select_columns(self):
+        rows = list(self.dk.images.select_columns('id', '_name', 'album'))
+        self.assertEqual(len(rows), len(list(self.dk.images)))
+        for id_, name, album in rows:
+            with self.subTest(imageid = id_):
+                img = self.dk.images[id_]
+                self.assertEqual(name, img.name)
+                self.assertEqual(album, img._album)
+        for id_, in self.dk.images.select_columns('id', name = name):
+            self.assertEqual(self.dk.images[id_].name, name)
+        with self.assertRaises(ValueError):
+            self.dk.images.select_columns()
+    
+    def test34_select_with(self):
+        images = self.dk.images.select_with(
+            'album', 'information', 'position', 'tags'
+        ).all()
+        self.assertEqual(len(images), len(list(self.dk.images)))
+        for img in images:
+            with self.subTest(imageid = img.id):
+                self.assertIs(img, self.dk.images[img.id])
+                for attr in ('_albumObj', '_information', '_position', '_tags'):
+                    self.assertIn(attr, img.__dict__)
+        with self.assertRaises(ValueError):
+            self.dk.images.select_with('captions')
+        checkedout = []
+        
+        def checkout(*args):
+            checkedout.append(1)
+        
+        def checkin(*args):
+            checkedout.append(-1)
+        
+        pool = self.dk.session.get_bind().pool
+        event.listen(pool, 'checkout', checkout)
+        event.listen(pool, 'checkin', checkin)
+        try:
+            for _ in range(3):
+                strict = self.dk.images.select_with('information', strict = True)
+        finally:
+            event.remove(pool, 'checkout', checkout)
+            event.remove(pool, 'checkin', checkin)
+        # No connection is left checked out
+        self.assertEqual(sum(checkedout), 0)
+        self.assertIsInstance(strict, list)
+        img = strict[0]
+        self.assertIn('_information', img.__dict__)
+        # Loaded data stays usable
+        self.assertEqual(img.name, self.dk.images[img.id].name)
+        self.assertEqual(
+            img.information.rating,
+            self.dk.images[img.id].information.rating
+        )
+        with self.assertRaises(DetachedInstanceError):
+            img.imagemeta
+        # Images in the main session are not affected
+        shared = self.dk.images[img.id]
+        self.assertIsNot(shared, img)
+        shared.imagemeta
+    
+    def test35_find_many(self):
+        paths = [img.abspath for img in self.dk.images if img.abspath]
+        paths.append(os.path.join(self.mydir, 'does_not_exist.jpg'))
+        found = self.dk.images.find_many(paths)
+        self.assertEqual(sorted(found), sorted(paths))
+        self.assertEqual(found[paths[-1]], [])
+        for path in paths:
+            with self.subTest(path = path):
+                self.assertEqual(found[path], self.dk.images.find(path))
+        # Same results as find() for single paths, also with changed case
+        for path in paths[:5]:
+            dir_, base = os.path.split(path)
+            for p in (path, os.path.join(dir_, base.swapcase())):
+                with self.subTest(path = p):
+                    self.assertEqual(
+                        self.dk.images.find_many([p])[p],
+                        self.dk.images.find(p)
+                    )
+    
+    def test36_interned_strings(self):
+        cls = self.dk.images.ImageComment
+        for language, author in self.dk.session.execute(
+            select(cls._language, cls._author)
+        ):
+            with self.subTest(language = language, author = author):
+                self.assertIs(language, sys.intern(language))
+                if author is not None:
+                    self.assertIs(author, sys.intern(author))
+    
     def test40_tags(self):
         for tag in self.dk.tags:
             with self.subTest(tagid = tag.id):
@@ -119,4 +241,10 @@ class SanityCheck:
             settings[k] = v
         for k in self.dk.settings:
             self.assertEqual(self.dk.settings[k], settings[k])
-
+    
+    def test60_session_scope(self):
+        with self.dk.session_scope() as s:
+            self.assertIsNot(s, self.dk.session)
+            ids = sorted(img.id for img in s.query(self.dk.images.Class))
+        self.assertEqual(ids, sorted(img.id for img in self.dk.images))
+        self.assertTrue(self.dk.session.expire_on_commit)